@@ -0,0 +1,140 @@
+import asyncio
+import logging
+
+import asyncpg
+from faker import Faker
+
+from config import settings
+from main import print_table
+
+logger = logging.getLogger(__name__)
+
+faker = Faker()
+
+ROW_LIMIT = 30
+
+
+async def create_connection():
+    connection = None
+    try:
+        connection = await asyncpg.connect(
+            database=settings.db_name,
+            user=settings.db_user,
+            password=settings.db_password,
+            host=settings.db_host,
+            port=settings.db_port,
+        )
+        logger.info('Connection to PostgreSQL DB successful')
+    except (OSError, asyncpg.PostgresError) as e:
+        logger.error("The error '%s' occurred", e)
+    return connection
+
+
+class AsyncQueryExecutor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    async def execute_query(self, query, description, *params, print_success=True):
+        try:
+            await self.connection.execute(query, *params)
+            if print_success:
+                logger.info('Query "%s" executed successfully!', description)
+        except asyncpg.PostgresError as e:
+            logger.error("The error '%s' occurred", e)
+
+    async def execute_read_query(self, query, description, *params, print_success=True):
+        try:
+            records = await self.connection.fetch(query, *params)
+            if print_success:
+                logger.info('Query "%s" executed successfully!', description)
+            if not records:
+                return [], []
+            return list(records[0].keys()), [tuple(record) for record in records]
+        except asyncpg.PostgresError as e:
+            logger.error("The error '%s' occurred", e)
+            return None
+
+
+class AsyncCreateTable(AsyncQueryExecutor):
+    async def create_students_table(self):
+        create_students_query = '''
+            CREATE TABLE IF NOT EXISTS students (
+                id SERIAL PRIMARY KEY,
+                name VARCHAR(255) NOT NULL,
+                birth_date DATE,
+                "group" INTEGER
+            )
+        '''
+        await self.execute_query(create_students_query, 'create students table')
+
+    async def create_scores_table(self):
+        create_scores_query = '''
+            CREATE TABLE IF NOT EXISTS scores (
+                id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+                student_id INTEGER REFERENCES students(id) ON DELETE CASCADE,
+                score INTEGER
+            )
+        '''
+        await self.execute_query(create_scores_query, 'create scores table')
+
+
+class AsyncInsertData(AsyncQueryExecutor):
+    async def insert_students(self, students_number: int):
+        rows = [
+            (faker.name(), faker.date_of_birth(), faker.random_int(1, 10))
+            for _ in range(students_number)
+        ]
+        try:
+            await self.connection.copy_records_to_table(
+                'students',
+                records=rows,
+                columns=['name', 'birth_date', 'group'],
+            )
+            logger.info('Students table filled successfully!')
+        except asyncpg.PostgresError as e:
+            logger.error("The error '%s' occurred", e)
+
+    async def insert_scores(self):
+        await self.execute_query(
+            'INSERT INTO scores (student_id, score) SELECT id, floor(random() * 101)::int FROM students',
+            'insert scores',
+            print_success=False,
+        )
+        logger.info('Scores table filled successfully!')
+
+
+class AsyncComplexQuery(AsyncQueryExecutor):
+    async def calculate_group_average_score(self):
+        average_score_query = '''
+            SELECT students."group", AVG(scores.score) AS average_score
+            FROM students
+            JOIN scores ON students.id = scores.student_id
+            GROUP BY students."group"
+            ORDER BY students."group"
+        '''
+        return await self.execute_read_query(average_score_query, 'calculate group average score')
+
+
+async def main() -> None:
+    connection = await create_connection()
+    if connection is None:
+        return
+
+    create_table = AsyncCreateTable(connection)
+    await create_table.create_students_table()
+    await create_table.create_scores_table()
+
+    insert_data = AsyncInsertData(connection)
+    await insert_data.insert_students(10)
+    await insert_data.insert_scores()
+
+    complex_query = AsyncComplexQuery(connection)
+    average_scores = await complex_query.calculate_group_average_score()
+    if average_scores is not None:
+        print_table(*average_scores)
+
+    await connection.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,20 @@
+from main import QueryExecutor, create_connection, release_connection
+
+
+def clear_tables() -> None:
+    connection = create_connection()
+    if connection is None:
+        return
+
+    with connection:
+        executor = QueryExecutor(connection)
+        executor.execute_query(
+            'TRUNCATE TABLE students, scores RESTART IDENTITY',
+            'truncate tables',
+        )
+
+    release_connection(connection)
+
+
+if __name__ == '__main__':
+    clear_tables()
@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from os import environ, path
+
+from dotenv import load_dotenv
+
+DOTENV_PATH = path.join(path.dirname(path.realpath(__file__)), '..', '..', 'docker', '.env')
+
+# Importing this module loads the .env exactly once per process: Python
+# caches the module, so repeated imports don't re-read the file.
+load_dotenv(dotenv_path=DOTENV_PATH)
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    db_name: str | None
+    db_user: str | None
+    db_password: str | None
+    db_host: str
+    db_port: int
+
+    @classmethod
+    def from_env(cls) -> 'Settings':
+        return cls(
+            db_name=environ.get('POSTGRES_DB'),
+            db_user=environ.get('POSTGRES_USER'),
+            db_password=environ.get('POSTGRES_PASSWORD'),
+            db_host=environ.get('POSTGRES_HOST', '127.0.0.1'),
+            db_port=int(environ.get('POSTGRES_PORT', 15432)),
+        )
+
+
+settings = Settings.from_env()
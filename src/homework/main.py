@@ -1,5 +1,385 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import md5
+from io import StringIO
+from weakref import WeakKeyDictionary
+
+import numpy as np
+from faker import Faker
+from psycopg2 import DatabaseError, OperationalError, ProgrammingError, sql
+from psycopg2.pool import ThreadedConnectionPool
+from tabulate import tabulate
+
+from config import settings
+
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
+
+faker = Faker()
+rng = np.random.default_rng()
+
+ROW_LIMIT = 30
+COPY_CHUNK_SIZE = 5000
+NAME_POOL_SIZE = 256
+
+
+_pool = None
+
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        try:
+            _pool = ThreadedConnectionPool(
+                minconn=1,
+                maxconn=8,
+                database=settings.db_name,
+                user=settings.db_user,
+                password=settings.db_password,
+                host=settings.db_host,
+                port=settings.db_port,
+            )
+        except (OperationalError, ProgrammingError) as e:
+            logger.error("The error '%s' occurred", e)
+    return _pool
+
+
+def create_connection():
+    pool = get_pool()
+    if pool is None:
+        return None
+    connection = pool.getconn()
+    logger.info('Connection to PostgreSQL DB successful')
+    return connection
+
+
+def release_connection(connection) -> None:
+    if _pool is not None:
+        _pool.putconn(connection)
+
+
+def print_table(column_names, data) -> None:
+    print(tabulate(data, headers=column_names, tablefmt='pretty'))
+
+
+# PREPARE state lives on the connection session, not on the executor, and the
+# pool hands sessions back to later callers — so the name cache is keyed by
+# connection, or a fresh executor would re-PREPARE on a warm connection and
+# fail with DuplicatePreparedStatement.
+_prepared_statements: WeakKeyDictionary = WeakKeyDictionary()
+
+
+class QueryExecutor:
+    def __init__(self, connection):
+        self.connection = connection
+        self._prepared: dict[str, str] = _prepared_statements.setdefault(connection, {})
+        self._stream_count = 0
+        self._cursor = None
+
+    def _get_cursor(self):
+        if self._cursor is None or self._cursor.closed:
+            self._cursor = self.connection.cursor()
+        return self._cursor
+
+    def close(self) -> None:
+        if self._cursor is not None:
+            self._cursor.close()
+            self._cursor = None
+
+    def _reset_after_error(self) -> None:
+        # A failed statement aborts the surrounding transaction, so roll back
+        # or every later statement fails with 'current transaction is
+        # aborted'. The rollback also deallocates statements PREPAREd inside
+        # that transaction; DEALLOCATE ALL and an empty cache bring the
+        # session and the cache back in sync.
+        self.connection.rollback()
+        self._get_cursor().execute('DEALLOCATE ALL')
+        self._prepared.clear()
+
+    def _as_prepared(self, query, params):
+        if params is None or not isinstance(query, str):
+            return query
+        statement_name = self._prepared.get(query)
+        if statement_name is None:
+            statement_name = f'stmt_{md5(query.encode()).hexdigest()[:8]}'
+            prepared_query = query
+            for index in range(1, query.count('%s') + 1):
+                prepared_query = prepared_query.replace('%s', f'${index}', 1)
+            self._get_cursor().execute(f'PREPARE {statement_name} AS {prepared_query}')
+            self._prepared[query] = statement_name
+        placeholders = ', '.join(['%s'] * len(params))
+        return f'EXECUTE {statement_name} ({placeholders})'
+
+    def execute_query(self, query, description, params=None, print_success=True):
+        cursor = self._get_cursor()
+        try:
+            cursor.execute(self._as_prepared(query, params), params)
+            if print_success:
+                logger.info('Query "%s" executed successfully!', description)
+        except DatabaseError as e:
+            self._reset_after_error()
+            logger.error("The error '%s' occurred", e)
+
+    def execute_read_query(self, query, description, params=None, print_success=True):
+        cursor = self._get_cursor()
+        try:
+            cursor.execute(self._as_prepared(query, params), params)
+            data = cursor.fetchall()
+            column_names = [description[0] for description in cursor.description]
+            if print_success:
+                logger.info('Query "%s" executed successfully!', description)
+            return column_names, data
+        except DatabaseError as e:
+            self._reset_after_error()
+            logger.error("The error '%s' occurred", e)
+            return None
+
+    def execute_stream_query(self, query, description, params=None, itersize=1000, print_success=True):
+        # Named (server-side) cursor: rows are fetched in itersize batches,
+        # so client memory stays bounded however large the result set is.
+        self._stream_count += 1
+        cursor = self.connection.cursor(name=f'stream_{self._stream_count}')
+        cursor.itersize = itersize
+        try:
+            cursor.execute(query, params)
+            if print_success:
+                logger.info('Query "%s" executed successfully!', description)
+            return cursor
+        except DatabaseError as e:
+            self._reset_after_error()
+            logger.error("The error '%s' occurred", e)
+            return None
+
+
+class CreateTable(QueryExecutor):
+    create_students_query = '''
+        CREATE TABLE IF NOT EXISTS students (
+            id SERIAL PRIMARY KEY,
+            name VARCHAR(255) NOT NULL,
+            birth_date DATE,
+            "group" INTEGER
+        )
+    '''
+    create_scores_query = '''
+        CREATE TABLE IF NOT EXISTS scores (
+            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+            student_id INTEGER REFERENCES students(id) ON DELETE CASCADE,
+            score INTEGER
+        )
+    '''
+    # Index "group" so the average-score JOIN, fetch_group and delete_group
+    # use an index scan instead of a seq scan; same for the scores side of
+    # the JOIN on student_id.
+    create_students_index_query = 'CREATE INDEX IF NOT EXISTS idx_students_group ON students ("group")'
+    create_scores_index_query = 'CREATE INDEX IF NOT EXISTS idx_scores_student ON scores (student_id)'
+    # pg_trgm lets the ILIKE '%...%' in search_student_by_name use a GIN
+    # index instead of a per-row case-folded substring scan.
+    create_name_trgm_index_query = (
+        'CREATE EXTENSION IF NOT EXISTS pg_trgm; '
+        'CREATE INDEX IF NOT EXISTS idx_students_name_trgm ON students USING gin (name gin_trgm_ops)'
+    )
+
+    def create_students_table(self):
+        self.execute_query(
+            f'{self.create_students_query}; {self.create_students_index_query}; '
+            f'{self.create_name_trgm_index_query}',
+            'create students table',
+        )
+
+    def create_scores_table(self):
+        self.execute_query(
+            f'{self.create_scores_query}; {self.create_scores_index_query}',
+            'create scores table',
+        )
+
+    def create_tables(self):
+        self.execute_query(
+            f'{self.create_students_query}; {self.create_scores_query}; '
+            f'{self.create_students_index_query}; {self.create_scores_index_query}; '
+            f'{self.create_name_trgm_index_query}',
+            'create tables',
+        )
+
+
+def generate_students(students_number: int):
+    # Faker is pure Python and dominates generation time for large N, so
+    # only a small pool of names goes through it; groups and birth dates
+    # come from vectorized numpy draws.
+    name_pool = [faker.name() for _ in range(min(NAME_POOL_SIZE, students_number))]
+    names = rng.choice(name_pool, students_number)
+    groups = rng.integers(1, 11, students_number)
+    birth_offsets = rng.integers(0, 365 * 60, students_number)
+    birth_dates = np.datetime64('1960-01-01') + birth_offsets.astype('timedelta64[D]')
+    return list(zip(names, birth_dates, groups))
+
+
+def escape_copy_text(value: str) -> str:
+    return (
+        value.replace('\\', '\\\\')
+        .replace('\t', '\\t')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+    )
+
+
+def build_students_buffer(students_number: int) -> StringIO:
+    buffer = StringIO()
+    for name, birth_date, group in generate_students(students_number):
+        buffer.write(f'{escape_copy_text(name)}\t{birth_date}\t{group}\n')
+    buffer.seek(0)
+    return buffer
+
+
+class InsertData(QueryExecutor):
+    def insert_students(self, students_number: int):
+        chunk_sizes = [COPY_CHUNK_SIZE] * (students_number // COPY_CHUNK_SIZE)
+        if students_number % COPY_CHUNK_SIZE:
+            chunk_sizes.append(students_number % COPY_CHUNK_SIZE)
+        if not chunk_sizes:
+            return
+        cursor = self._get_cursor()
+        try:
+            # The next chunk is generated in a worker thread while the current
+            # one is COPYed: psycopg2 releases the GIL during network I/O, so
+            # the Faker CPU work overlaps the transfer.
+            with ThreadPoolExecutor(max_workers=1) as generator:
+                future = generator.submit(build_students_buffer, chunk_sizes[0])
+                for index in range(len(chunk_sizes)):
+                    buffer = future.result()
+                    if index + 1 < len(chunk_sizes):
+                        future = generator.submit(build_students_buffer, chunk_sizes[index + 1])
+                    cursor.copy_expert(
+                        'COPY students (name, birth_date, "group") FROM STDIN WITH (FORMAT text)',
+                        buffer,
+                    )
+            logger.info('Students table filled successfully!')
+        except DatabaseError as e:
+            self._reset_after_error()
+            logger.error("The error '%s' occurred", e)
+
+    def insert_scores(self):
+        insert_scores_query = '''
+            INSERT INTO scores (student_id, score)
+            SELECT id, floor(random() * 101)::int
+            FROM students
+            WHERE NOT EXISTS (
+                SELECT 1 FROM scores WHERE scores.student_id = students.id
+            )
+        '''
+        self.execute_query(insert_scores_query, 'insert scores', print_success=False)
+        logger.info('Scores table filled successfully!')
+
+
+class UpdateData(QueryExecutor):
+    def update_group(self, student_id: int, new_group: int):
+        self.execute_query(
+            'UPDATE students SET "group" = %s WHERE id = %s',
+            'update student group',
+            (new_group, student_id),
+        )
+
+    def update_score(self, student_id: int, new_score: int):
+        self.execute_query(
+            'UPDATE scores SET score = %s WHERE student_id = %s',
+            'update student score',
+            (new_score, student_id),
+        )
+
+
+class DeleteData(QueryExecutor):
+    def delete_group(self, group: int):
+        self.execute_query(
+            'DELETE FROM students WHERE "group" = %s',
+            'delete students group',
+            (group,),
+        )
+
+
+class SelectData(QueryExecutor):
+    def fetch_group(self, group: int):
+        return self.execute_read_query(
+            f'SELECT id, name, birth_date, "group" FROM students WHERE "group" = %s LIMIT {ROW_LIMIT}',
+            'select students group',
+            (group,),
+        )
+
+
+class ComplexQuery(QueryExecutor):
+    def calculate_group_average_score(self):
+        average_score_query = '''
+            SELECT students."group", AVG(scores.score) AS average_score
+            FROM students
+            JOIN scores ON students.id = scores.student_id
+            GROUP BY students."group"
+            ORDER BY students."group"
+        '''
+        return self.execute_read_query(average_score_query, 'calculate group average score')
+
+
+class AdditionalFeatures(QueryExecutor):
+    def search_student_by_name(self, partial_name: str):
+        return self.execute_stream_query(
+            'SELECT * FROM students WHERE name ILIKE %s',
+            'search student by name',
+            (f'%{partial_name}%',),
+        )
+
+    def fetch_sorted_data(self, table_name: str, column: str, columns: list[str]):
+        sorted_data_query = sql.SQL('SELECT {columns} FROM {table} ORDER BY {order} LIMIT {limit}').format(
+            columns=sql.SQL(', ').join(map(sql.Identifier, columns)),
+            table=sql.Identifier(table_name),
+            order=sql.Identifier(column),
+            limit=sql.Literal(ROW_LIMIT),
+        )
+        return self.execute_read_query(
+            sorted_data_query,
+            f'select sorted data from {table_name}',
+        )
+
+
 def main() -> None:
-    ...
+    connection = create_connection()
+    if connection is None:
+        return
+
+    with connection:
+        create_table = CreateTable(connection)
+        create_table.create_tables()
+
+        insert_data = InsertData(connection)
+        insert_data.insert_students(10)
+        insert_data.insert_scores()
+
+        update_data = UpdateData(connection)
+        update_data.update_group(1, 5)
+        update_data.update_score(1, 100)
+
+        delete_data = DeleteData(connection)
+        delete_data.delete_group(10)
+
+        select_data = SelectData(connection)
+        group = select_data.fetch_group(5)
+        if group is not None:
+            print_table(*group)
+
+        complex_query = ComplexQuery(connection)
+        average_scores = complex_query.calculate_group_average_score()
+        if average_scores is not None:
+            print_table(*average_scores)
+
+        additional_features = AdditionalFeatures(connection)
+        found_students = additional_features.search_student_by_name('a')
+        if found_students is not None:
+            for student in found_students:
+                print(student)
+
+        sorted_students = additional_features.fetch_sorted_data(
+            'students', 'birth_date', ['id', 'name', 'birth_date', 'group']
+        )
+        if sorted_students is not None:
+            print_table(*sorted_students)
+
+    release_connection(connection)
 
 
 if __name__ == '__main__':